@@ -46,10 +46,12 @@ side effects beyond reading input CSV files and writing cleaned output files.
 """
 
 import csv
-import re
 import ast
 import time
-from typing import List, Dict, Tuple, Set, Optional
+import functools
+from collections import defaultdict
+from operator import itemgetter
+from typing import List, Dict, DefaultDict, Tuple, Set, Optional
 
 def read_csv_file(file_name: str) -> List[List[str]]:
     """
@@ -73,13 +75,13 @@ def read_csv_file(file_name: str) -> List[List[str]]:
     - This function does not perform type conversion; all values are returned as strings.
     - Leading byte order marks (BOM) are handled via UTF-8-SIG decoding.
     - Intended as a simple CSV loader for all project datasets in Milestone 1 and 2.
+    - Rows are materialized with a single list() call over the reader so the
+      C-level csv parser drives the whole file without a Python-level loop.
     """
     data_set: List[List[str]] = []
     try:
         with open(file_name, mode="r", encoding="utf-8-sig") as file:
-            csv_reader = csv.reader(file)
-            for row in csv_reader:
-                data_set.append(row)
+            data_set = list(csv.reader(file))
     except FileNotFoundError:
         print(f"Warning: File {file_name} not found")
     return data_set
@@ -110,14 +112,37 @@ def write_csv_file(file_name: str, data_set: List[List[str]]) -> None:
       validate, or transform data.
     - UTF-8 encoding is used for full compatibility with international characters.
     - Ensures proper newline handling across operating systems (via newline="").
+    - A 1 MiB write buffer lets the csv writer emit large files in a small
+      number of write calls.
     """
-    with open(file_name, mode="w", newline="", encoding="utf-8") as file:
+    with open(file_name, mode="w", newline="", encoding="utf-8",
+              buffering=1 << 20) as file:
         csv_writer = csv.writer(file)
         csv_writer.writerows(data_set)
 
 
 # ==================== DATE CLEANING FOR BORN COLUMN By Navish and Minhaz ====================
 
+# Lookups are built once at import time and shared by the birthdate and games
+# date cleaners, so nothing here is rebuilt per call.
+_MONTH_MAP: Dict[str, str] = {
+    "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
+    "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
+    "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec",
+    "jan": "Jan", "feb": "Feb", "mar": "Mar", "apr": "Apr",
+    "jun": "Jun", "jul": "Jul", "aug": "Aug", "sep": "Sep",
+    "oct": "Oct", "nov": "Nov", "dec": "Dec",
+}
+# Title-case spellings ('Aug', 'January') are by far the most common in the
+# data; keying them directly lets most lookups skip the lower() call.
+_MONTH_MAP.update({name.title(): abbr for name, abbr in list(_MONTH_MAP.items())})
+
+_MONTH_ABBRS: Tuple[str, ...] = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
+
+@functools.lru_cache(maxsize=131072)
 def clean_birth_date_enhanced(date_str: str) -> str:
     """
     Normalize inconsistent birthdate formats into a standard 'dd-Mon-yyyy' format.
@@ -163,6 +188,8 @@ def clean_birth_date_enhanced(date_str: str) -> str:
     - For year-only inputs, day defaults to '01-Jan'.
     - This function is designed specifically for the known irregularities in the
       Olympic data, not general-purpose date parsing.
+    - The function is pure, so results are memoized with lru_cache; repeated
+      raw values (shared years, blanks) cost a single cache lookup.
     """
 
     if not date_str or not date_str.strip():
@@ -170,98 +197,145 @@ def clean_birth_date_enhanced(date_str: str) -> str:
 
     s = date_str.strip()
 
-    # NEW: handle ISO-style dates from Paris files: yyyy-mm-dd
-    iso_match = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})$", date_str)
-    
-    if iso_match:
-        year = int(iso_match.group(1))
-        month = int(iso_match.group(2))
-        day = int(iso_match.group(3))
-
-        # basic sanity checks
-        if not (1800 <= year <= 2025 and 1 <= month <= 12 and 1 <= day <= 31):
-            return ""
-
-        month_abbrs = [
-            "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
-        ]
-        month_abbr = month_abbrs[month - 1]
-
-        # convert to the standard format used everywhere else
-        return f"{day:02d}-{month_abbr}-{year}"
-    
-    # --- Month helpers (only what we need) ---
-    def month_abbrev_from_any(name: str) -> Optional[str]:
-        """
-        Convert a month name or abbreviation (any casing) into a standardized
-        three-letter month abbreviation (e.g., 'January' → 'Jan'). Returns None
-        if the input does not match a known month.
-        """
-        name = name.strip().lower()
-        month_map = {
-            "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
-            "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
-            "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec",
-            "jan": "Jan", "feb": "Feb", "mar": "Mar", "apr": "Apr",
-            "jun": "Jun", "jul": "Jul", "aug": "Aug", "sep": "Sep",
-            "oct": "Oct", "nov": "Nov", "dec": "Dec",
-        }
-        return month_map.get(name)
-
-    # -------------------------------------------------
-    # 1) dd-Mon-yy or dd-Mon-yyyy  (e.g. 11-Aug-41)
-    # -------------------------------------------------
-    m = re.match(r"^(\d{1,2})-([A-Za-z]{3})-(\d{2}|\d{4})$", s)
-    if m:
-        day = int(m.group(1))
-        month = month_abbrev_from_any(m.group(2))
-        year_str = m.group(3)
-
-        if not month or not (1 <= day <= 31):
-            return ""
-
-        if len(year_str) == 2:
-            y2 = int(year_str)
-            # Your rule:
-            #   00–07 -> 2000–2007
-            #   08–99 -> 1900–1999
-            if y2 < 8:
-                year = 2000 + y2
+    # The formats below are recognised with plain splits and character-class
+    # checks instead of regular expressions. isdecimal() accepts exactly the
+    # characters matched by the regex class \d.
+    parts = s.split("-")
+    if len(parts) == 3:
+        first, mid, last = parts
+
+        # NEW: handle ISO-style dates from Paris files: yyyy-mm-dd
+        # (only when the raw value has no surrounding whitespace, except a
+        # single trailing newline, which the old `$`-anchored regex allowed)
+        if ((date_str == s or date_str == s + "\n") and len(first) == 4
+                and 0 < len(mid) <= 2 and 0 < len(last) <= 2
+                and first.isdecimal() and mid.isdecimal() and last.isdecimal()):
+            year = int(first)
+            month = int(mid)
+            day = int(last)
+
+            # basic sanity checks
+            if not (1800 <= year <= 2025 and 1 <= month <= 12 and 1 <= day <= 31):
+                return ""
+
+            month_abbr = _MONTH_ABBRS[month - 1]
+
+            # convert to the standard format used everywhere else
+            return f"{day:02d}-{month_abbr}-{year}"
+
+        # -------------------------------------------------
+        # 1) dd-Mon-yy or dd-Mon-yyyy  (e.g. 11-Aug-41)
+        # -------------------------------------------------
+        if (0 < len(first) <= 2 and len(mid) == 3 and len(last) in (2, 4)
+                and first.isdecimal() and last.isdecimal()
+                and mid.isascii() and mid.isalpha()):
+            day = int(first)
+            month = _MONTH_MAP.get(mid) or _MONTH_MAP.get(mid.lower())
+
+            if not month or not (1 <= day <= 31):
+                return ""
+
+            if len(last) == 2:
+                y2 = int(last)
+                # Your rule:
+                #   00–07 -> 2000–2007
+                #   08–99 -> 1900–1999
+                if y2 < 8:
+                    year = 2000 + y2
+                else:
+                    year = 1900 + y2
             else:
-                year = 1900 + y2
-        else:
-            year = int(year_str)
+                year = int(last)
 
-        return f"{day:02d}-{month}-{year}"
+            return f"{day:02d}-{month}-{year}"
 
     # -------------------------------------------------
     # 2) dd Month yyyy  (e.g. 25 January 1884)
     # -------------------------------------------------
-    m = re.match(r"^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$", s)
-    if m:
-        day = int(m.group(1))
-        month = month_abbrev_from_any(m.group(2))
-        year = int(m.group(3))
-
-        if month and 1 <= day <= 31:
-            return f"{day:02d}-{month}-{year}"
+    tokens = s.split()
+    if len(tokens) == 3:
+        day_str, month_str, year_str = tokens
+        if (0 < len(day_str) <= 2 and len(year_str) == 4
+                and day_str.isdecimal() and year_str.isdecimal()
+                and month_str.isascii() and month_str.isalpha()):
+            day = int(day_str)
+            month = _MONTH_MAP.get(month_str) or _MONTH_MAP.get(month_str.lower())
+
+            if month and 1 <= day <= 31:
+                return f"{day:02d}-{month}-{int(year_str)}"
 
     # -------------------------------------------------
     # 3) Year only OR year inside text
     #    (1884), circa 1884, c. 1884, etc.
+    #    The first run of four digits is taken as the year.
     # -------------------------------------------------
-    m = re.search(r"(\d{4})", s)
-    if m:
-        year = int(m.group(1))
-        # No lower bound: allow years before 1880 as requested
-        return f"01-Jan-{year}"
+    run = 0
+    for i, ch in enumerate(s):
+        if ch.isdecimal():
+            run += 1
+            if run == 4:
+                # No lower bound: allow years before 1880 as requested
+                return f"01-Jan-{int(s[i - 3:i + 1])}"
+        else:
+            run = 0
 
     # If nothing matches, treat as missing
     return ""
 
 # ==================== DATE CLEANING FOR OLYMPIC GAMES By Minhaz and Navish  ====================
 
+def _fast_day_parse(s: str) -> int:
+    """
+    Decode a day number such as '6' or '23' in a single pass, replacing the
+    `s.isdigit()` check followed by `int(s)`. One- and two-character ASCII
+    inputs are decoded with ord() arithmetic; anything else falls back to
+    int() guarded by isdecimal(), which accepts exactly the strings int()
+    can parse (isdigit() would also pass digits such as '²' that int()
+    rejects). Returns -1 when `s` is not a number.
+    """
+    n = len(s)
+    if n == 1:
+        d0 = ord(s) - 48
+        if 0 <= d0 <= 9:
+            return d0
+    elif n == 2:
+        d0 = ord(s[0]) - 48
+        d1 = ord(s[1]) - 48
+        if 0 <= d0 <= 9 and 0 <= d1 <= 9:
+            return d0 * 10 + d1
+    return int(s) if s.isdecimal() else -1
+
+@functools.lru_cache(maxsize=4096)
+def _parse_games_day_month(date_str: str) -> Optional[Tuple[int, str]]:
+    """
+    Extract (day, month_abbr) from a single Games date such as '6 April' or
+    '23 July 2021'. Any year in the text is validated but not returned,
+    because callers always enforce the edition year. Returns None when the
+    text is not a recognisable single date. Memoized with lru_cache.
+    """
+    # split() with no argument also drops surrounding whitespace
+    parts = date_str.split()
+    
+    # Case: "6 April"
+    if len(parts) == 2:
+        d, m = parts
+        day = _fast_day_parse(d)
+        if day >= 0:
+            abbr = _MONTH_MAP.get(m) or _MONTH_MAP.get(m.lower())
+            if abbr:
+                return day, abbr
+
+    # Case: "23 July 2021" -> We must IGNORE 2021 and use the edition year
+    elif len(parts) == 3:
+        d, m, y_str = parts
+        day = _fast_day_parse(d)
+        if day >= 0 and y_str.isdigit():
+            abbr = _MONTH_MAP.get(m) or _MONTH_MAP.get(m.lower())
+            if abbr:
+                return day, abbr
+                
+    return None
+
 def clean_single_games_date_enhanced(date_str: str, year: int) -> str:
     """
     Normalize a single Olympic Games date into the format 'dd-Mon-yyyy', forcing
@@ -305,44 +379,20 @@ def clean_single_games_date_enhanced(date_str: str, year: int) -> str:
     - The function intentionally ignores any explicit year found in `date_str`.
     - Only single-day dates are processed here; multi-range dates are handled by
       `clean_games_date_enhanced`.
+    - Day/month extraction is delegated to the memoized
+      `_parse_games_day_month`; this function only adds the year.
     """
 
     if not date_str:
         return ""
-    
-    s = date_str.strip()
-    if not s:
-        return ""
-
-    month_map = {
-        'january': 'Jan', 'february': 'Feb', 'march': 'Mar', 'april': 'Apr',
-        'may': 'May', 'june': 'Jun', 'july': 'Jul', 'august': 'Aug',
-        'september': 'Sep', 'october': 'Oct', 'november': 'Nov', 'december': 'Dec',
-        'jan': 'Jan', 'feb': 'Feb', 'mar': 'Mar', 'apr': 'Apr',
-        'jun': 'Jun', 'jul': 'Jul', 'aug': 'Aug', 'sep': 'Sep',
-        'oct': 'Oct', 'nov': 'Nov', 'dec': 'Dec'
-    }
 
-    parts = s.split()
-    
-    # Case: "6 April"
-    if len(parts) == 2:
-        d, m = parts
-        if d.isdigit():
-            abbr = month_map.get(m.lower())
-            if abbr:
-                return f"{int(d):02d}-{abbr}-{year}"
+    parsed = _parse_games_day_month(date_str)
+    if not parsed:
+        return ""
 
-    # Case: "23 July 2021" -> We must IGNORE 2021 and use `year` (2020)
-    elif len(parts) == 3:
-        d, m, y_str = parts
-        if d.isdigit() and y_str.isdigit():
-            abbr = month_map.get(m.lower())
-            if abbr:
-                # CHANGED: We use {year} here, not {y_str}
-                return f"{int(d):02d}-{abbr}-{year}"
-                
-    return ""
+    day, abbr = parsed
+    # CHANGED: We use {year} here, never the year written in date_str
+    return f"{day:02d}-{abbr}-{year}"
 
 def clean_games_date_enhanced(date_str: str, year: int) -> str:
     """
@@ -366,15 +416,13 @@ def clean_games_date_enhanced(date_str: str, year: int) -> str:
     Behaviour
     ---------
     1. Splits the string on " – " to detect date ranges.
-    2. Cleans the end date first using `clean_single_games_date_enhanced`.
-       - If the end date contains an incorrect year, the supplied `year` parameter
+    2. Parses the end date first into (day, month).
+       - Any year written in the text is ignored; the supplied `year` parameter
          is enforced.
-    3. Extracts the year from the cleaned end date.
-       - This becomes the authoritative `actual_year`.
-    4. Cleans the start date using the extracted `actual_year`.
-       - Handles patterns like "6 – 13 April" where the start part may contain
-         only the day number.
-    5. Returns a normalized "start to end" string.
+    3. Parses the start date into (day, month).
+       - Handles patterns like "6 – 13 April" where the start part contains
+         only the day number; the month is then taken from the end date.
+    4. Formats both endpoints with `year` in a single "start to end" string.
 
     Parameters
     ----------
@@ -383,9 +431,8 @@ def clean_games_date_enhanced(date_str: str, year: int) -> str:
         date ranges, missing years, or mismatched years.
 
     year : int
-        The expected Olympic edition year. Used when the input date is missing a
-        year or contains an incorrect one, but may be overridden by the correct
-        year extracted from the end date.
+        The Olympic edition year. Used for both endpoints, whether the input
+        date is missing a year or contains an incorrect one.
 
     Returns
     -------
@@ -399,8 +446,9 @@ def clean_games_date_enhanced(date_str: str, year: int) -> str:
     - This function resolves cross-year issues (e.g., where Games run across two
       months or where the dataset contains inconsistent year labels).
     - Day-only start dates are interpreted based on the month/year of the end date.
-    - Multi-day date ranges are normalized using `clean_single_games_date_enhanced`
-      for both start and end components.
+    - Both endpoints are parsed into integer/abbreviation components and
+      formatted once at the end, rather than by slicing an already-formatted
+      end date.
     """
     
     if not date_str or date_str in {"", "—", "--", "–"}:
@@ -415,33 +463,29 @@ def clean_games_date_enhanced(date_str: str, year: int) -> str:
         start_raw = parts[0].strip()
         end_raw = parts[1].strip()
         
-        # 1. Clean the end date first
-        # If end_raw is "8 August 2021", end_date becomes "08-Aug-2021"
-        end_date = clean_single_games_date_enhanced(end_raw, year)
+        # 1. Parse the end date first
+        # If end_raw is "8 August 2021", end becomes (8, "Aug")
+        end = _parse_games_day_month(end_raw)
         
-        if not end_date:
+        if not end:
             return ""
 
-        # 2. Extract the actual year from the cleaned end date
-        # end_date format is always "DD-Mon-YYYY", so last 4 chars are the year.
-        try:
-            actual_year = int(end_date[-4:])
-        except (ValueError, IndexError):
-            actual_year = year
+        end_day, end_month = end
 
-        # 3. Clean Start Date using the ACTUAL year, not the default year
-        start_date = ""
-        
-        if start_raw.isdigit():
-            # Handle "6 – 13 April" -> "06-Apr-YYYY"
-            start_date = f"{int(start_raw):02d}{end_date[2:]}"
+        # 2. Parse the start date
+        start_day = _fast_day_parse(start_raw)
+        if start_day >= 0:
+            # Handle "6 – 13 April" -> day only, month comes from the end date
+            start_month = end_month
         else:
             # Handle "21 July – 8 August 2021"
-            # We pass 'actual_year' (2021) here instead of 'year' (2020)
-            start_date = clean_single_games_date_enhanced(start_raw, actual_year)
+            start = _parse_games_day_month(start_raw)
+            start_day, start_month = start if start else (-1, "")
             
-        if start_date:
-            return f"{start_date} to {end_date}"
+        # 3. Format both endpoints once, always with the edition year
+        if start_day >= 0:
+            return (f"{start_day:02d}-{start_month}-{year} to "
+                    f"{end_day:02d}-{end_month}-{year}")
             
     # Fallback: Treat as single date
     return clean_single_games_date_enhanced(s, year)
@@ -513,31 +557,34 @@ def clean_athlete_data(athlete_rows: List[List[str]]) -> Tuple[List[List[str]],
         return athlete_rows, {}
     
     cleaned = [header]
-    birth_dates = {}
-    athlete_name_noc_map = {}  # For duplicate checking
-    
+
+    # One pad list per possible deficit, built once instead of per short row
+    header_len = len(header)
+    pads = [[""] * i for i in range(header_len + 1)]
+
     for row in athlete_rows[1:]:
-        if len(row) < len(header):
-            row = row + [""] * (len(header) - len(row))
-        
-        athlete_id = row[id_idx].strip()
-        name = row[name_idx].strip().lower()
-        noc = row[noc_idx].strip().upper()
-        
-        # Store for duplicate checking
-        key = f"{name}_{noc}"
-        athlete_name_noc_map[key] = athlete_id
+        row_len = len(row)
+        if row_len < header_len:
+            row.extend(pads[header_len - row_len])
         
-        # Clean birth date
-        if born_idx < len(row):
-            original = row[born_idx]
-            cleaned_date = clean_birth_date_enhanced(original)
-            row[born_idx] = cleaned_date
-            
-            if cleaned_date:
-                birth_dates[athlete_id] = cleaned_date
+        # Clean birth date (memoized: repeated raw values are cache hits)
+        row[born_idx] = clean_birth_date_enhanced(row[born_idx])
         
         cleaned.append(row)
+
+    # Build both lookups with one dict comprehension each, straight from the
+    # cleaned rows, without materializing intermediate id/key columns.
+    body = cleaned[1:]
+
+    # Store for duplicate checking
+    athlete_name_noc_map = {
+        f"{row[name_idx].strip().lower()}_{row[noc_idx].strip().upper()}": row[id_idx].strip()
+        for row in body
+    }
+
+    birth_dates = {row[id_idx].strip(): row[born_idx]
+                   for row in body
+                   if row[born_idx]}
     
     return cleaned, birth_dates, athlete_name_noc_map
 
@@ -619,29 +666,35 @@ def clean_games_data(games_rows: List[List[str]]) -> Tuple[List[List[str]], str]
     cleaned = [header]
     paris_edition_id = ""
     
-    # Padding cache to avoid recreating list every loop
+    # Padding cache: one pad list per possible deficit, built once
     header_len = len(header)
-    empty_pad = [""] * header_len
+    pads = [[""] * i for i in range(header_len + 1)]
+
+    # Pull every field the loop needs in one C-level call per row
+    get_fields = itemgetter(idx_ed, idx_id, idx_yr, idx_city,
+                            idx_start, idx_end, idx_comp)
 
     for row in games_rows[1:]:
         # Fast padding
         row_len = len(row)
         if row_len < header_len:
-            row.extend(empty_pad[:header_len - row_len])
+            row.extend(pads[header_len - row_len])
+
+        edition, edition_id, year_str, city, start, end, comp = get_fields(row)
 
         # Parse Year
         try:
-            year = int(row[idx_yr])
+            year = int(year_str)
         except (ValueError, TypeError):
             year = None
 
         # Check Paris 2024 (Lazy check: only lower() if year is 2024)
         is_paris_2024 = False
         if year == 2024:
-            if "paris" in row[idx_city].lower() or "2024" in row[idx_ed]:
+            if "paris" in city.lower() or "2024" in edition:
                 is_paris_2024 = True
                 if not paris_edition_id:
-                    paris_edition_id = row[idx_id]
+                    paris_edition_id = edition_id
 
         if is_paris_2024:
             row[idx_start] = "26-Jul-2024"
@@ -650,15 +703,15 @@ def clean_games_data(games_rows: List[List[str]]) -> Tuple[List[List[str]], str]
         elif year:
             # Standard Cleaning
             # Note: start/end are single dates, competition is a range
-            if row[idx_start]:
-                row[idx_start] = clean_single_games_date_enhanced(row[idx_start], year)
+            if start:
+                row[idx_start] = clean_single_games_date_enhanced(start, year)
             
-            if row[idx_end]:
-                row[idx_end] = clean_single_games_date_enhanced(row[idx_end], year)
+            if end:
+                row[idx_end] = clean_single_games_date_enhanced(end, year)
                 
-            if row[idx_comp]:
+            if comp:
                 # This now handles "4 – 22 February" automatically
-                row[idx_comp] = clean_games_date_enhanced(row[idx_comp], year)
+                row[idx_comp] = clean_games_date_enhanced(comp, year)
 
         cleaned.append(row)
 
@@ -721,10 +774,11 @@ def clean_countries(country_rows: List[List[str]], paris_nocs: List[List[str]])
         return country_rows
     
     country_map = {}
+    min_len = max(noc_idx, country_idx) + 1
     
     # Add existing countries
     for row in country_rows[1:]:
-        if len(row) > max(noc_idx, country_idx):
+        if len(row) >= min_len:
             noc = row[noc_idx].strip().upper()
             country = row[country_idx].strip()
             if noc:
@@ -740,23 +794,104 @@ def clean_countries(country_rows: List[List[str]], paris_nocs: List[List[str]])
             p_code_idx = p_country_idx = -1
         
         if p_code_idx >= 0 and p_country_idx >= 0:
+            p_min_len = max(p_code_idx, p_country_idx) + 1
             for row in paris_nocs[1:]:
-                if len(row) > max(p_code_idx, p_country_idx):
+                if len(row) >= p_min_len:
                     noc = row[p_code_idx].strip().upper()
                     country = row[p_country_idx].strip()
                     if noc and noc not in country_map:
                         country_map[noc] = country
     
-    # Sort by country name
+    # Sort by country name (sorted() computes each lowercase key only once)
     sorted_items = sorted(country_map.items(), key=lambda x: x[1].lower())
-    result = [header]
-    for noc, country in sorted_items:
-        result.append([noc, country])
-    
-    return result
+    return [header] + [[noc, country] for noc, country in sorted_items]
 
 # ==================== CALCULATE AGE by Minhaz ====================
 
+_MONTH_NUMBERS: Dict[str, int] = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
+    'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
+    'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+def parse_dd_mon_yyyy(s: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a date string in the strict 'dd-Mon-yyyy' format and return
+    (year, month, day) as integers. Returns None if the string does not
+    match the expected pattern or contains invalid day/month values.
+    """
+    # Fixed layout: 'd-Mon-yyyy' (10 chars) or 'dd-Mon-yyyy' (11 chars), so
+    # every field sits at a known offset from the end of the string.
+    s = s.strip()
+    n = len(s)
+    if n != 10 and n != 11:
+        return None
+    if s[-5] != "-" or s[-9] != "-":
+        return None
+    day_str = s[:n - 9]
+    year_str = s[-4:]
+    if not (day_str.isdecimal() and year_str.isdecimal()):
+        return None
+    month = _MONTH_NUMBERS.get(s[-8:-5])
+    day = int(day_str)
+    if not month or not (1 <= day <= 31):
+        return None
+    return int(year_str), month, day
+
+def parse_event_window(event_date: str) -> Optional[Tuple[Tuple[int, int, int],
+                                                       Optional[Tuple[int, int, int]]]]:
+    """
+    Split a cleaned games date ('dd-Mon-yyyy' or 'dd-Mon-yyyy to dd-Mon-yyyy')
+    into parsed (start, end) tuples. `end` is None for single dates or when
+    the end part cannot be parsed. Returns None if the start date cannot be
+    parsed.
+    """
+    event_date = event_date.strip()
+    if "to" in event_date:
+        start_str, end_str = [part.strip() for part in event_date.split("to", 1)]
+    else:
+        start_str, end_str = event_date, ""
+
+    start = parse_dd_mon_yyyy(start_str)
+    if not start:
+        return None
+
+    end = parse_dd_mon_yyyy(end_str) if end_str else None
+    return start, end
+
+def _age_from_ymd(birth: Tuple[int, int, int],
+                  start: Tuple[int, int, int],
+                  end: Optional[Tuple[int, int, int]]) -> int:
+    """
+    Integer core of calculate_age(). Takes already-parsed (year, month, day)
+    tuples for the birth date and the games start/end dates and returns the
+    age, or -1 when the result falls outside the 0–120 sanity range. No
+    string work happens here, so callers can parse each distinct date once
+    and reuse the tuples.
+    """
+    birth_year, birth_month, birth_day = birth
+    start_year, start_month, start_day = start
+
+    # --- Age as of the START of the games (normal rule) ---
+    age = start_year - birth_year
+    if (start_month, start_day) < (birth_month, birth_day):
+        age -= 1
+
+    # --- Special rule: birthday occurs DURING the games window ---
+    # Represent the athlete's birthday in the games year
+    # (we only care about month/day compared to the games dates)
+    if end:
+        # Compare tuples like (year, month, day)
+        if start <= (start_year, birth_month, birth_day) <= end:
+            # Pretend the birthday already happened before the games began
+            age += 1
+
+    # Sanity check
+    if age < 0 or age > 120:
+        return -1
+
+    return age
+
 def calculate_age(birth_date: str, event_date: str) -> str:
     """
     Compute an athlete's age for a given Olympic edition based on the official
@@ -811,6 +946,9 @@ def calculate_age(birth_date: str, event_date: str) -> str:
       but the end date is used to determine the birthday-during-games exception.
     - The function is intentionally defensive: any parsing failure or unreasonable
       age results in returning an empty string.
+    - This is a thin string wrapper: parsing is done by parse_dd_mon_yyyy() and
+      the arithmetic by _age_from_ymd(), so callers that already hold parsed
+      dates can skip the string work entirely.
     """
 
     if not birth_date or not event_date:
@@ -819,77 +957,19 @@ def calculate_age(birth_date: str, event_date: str) -> str:
     birth_date = birth_date.strip()
     event_date = event_date.strip()
 
-    # Month mapping
-    month_map = {
-        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
-        'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
-        'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-    }
-
-    def parse_dd_mon_yyyy(s: str):
-        """
-        Parse a date string in the strict 'dd-Mon-yyyy' format and return
-        (year, month, day) as integers. Returns None if the string does not
-        match the expected pattern or contains invalid day/month values.
-        """
-        m = re.match(r"^\s*(\d{1,2})-([A-Z][a-z]{2})-(\d{4})\s*$", s)
-        if not m:
-            return None
-        day = int(m.group(1))
-        mon_abbr = m.group(2)
-        year = int(m.group(3))
-        month = month_map.get(mon_abbr)
-        if not month or not (1 <= day <= 31):
-            return None
-        return year, month, day
-
     try:
         # Parse birth date
         b = parse_dd_mon_yyyy(birth_date)
         if not b:
             return ""
-        birth_year, birth_month, birth_day = b
 
         # Parse event date(s)
-        if "to" in event_date:
-            start_str, end_str = [part.strip() for part in event_date.split("to", 1)]
-        else:
-            start_str, end_str = event_date, ""
-
-        start_parsed = parse_dd_mon_yyyy(start_str)
-        if not start_parsed:
+        window = parse_event_window(event_date)
+        if not window:
             return ""
 
-        start_year, start_month, start_day = start_parsed
-
-        end_parsed = parse_dd_mon_yyyy(end_str) if end_str else None
-        if end_parsed:
-            end_year, end_month, end_day = end_parsed
-        else:
-            end_year = end_month = end_day = None
-
-        # --- Age as of the START of the games (normal rule) ---
-        age = start_year - birth_year
-        if (start_month, start_day) < (birth_month, birth_day):
-            age -= 1
-
-        # --- Special rule: birthday occurs DURING the games window ---
-        # Represent the athlete's birthday in the games year
-        # (we only care about month/day compared to the games dates)
-        if end_parsed:
-            # birthday "this games year"
-            b_games_year = start_year
-            # Compare tuples like (year, month, day)
-            start_tuple = (start_year, start_month, start_day)
-            end_tuple = (end_year, end_month, end_day)
-            birthday_tuple = (b_games_year, birth_month, birth_day)
-
-            if start_tuple <= birthday_tuple <= end_tuple:
-                # Pretend the birthday already happened before the games began
-                age += 1
-
-        # Sanity check
-        if age < 0 or age > 120:
+        age = _age_from_ymd(b, *window)
+        if age < 0:
             return ""
 
         return str(age)
@@ -916,8 +996,9 @@ def add_age_to_events(event_rows: List[List[str]],
          - Otherwise build a range 'start_date to end_date'.
          - If only start_date exists, use that single date.
       2. Retrieve the athlete's cleaned birthdate.
-      3. Compute age using calculate_age(), which applies the birthday-during-games
-         adjustment when appropriate.
+      3. Compute age with _age_from_ymd() on the pre-parsed birth date and
+         edition window tuples, applying the same rules as calculate_age()
+         (including the birthday-during-games adjustment).
       4. Append the resulting age to the output dataset.
 
     Parameters
@@ -949,6 +1030,9 @@ def add_age_to_events(event_rows: List[List[str]],
     -----
     - The function builds a complete edition_id → event_date mapping before
       processing events to avoid repeated lookups.
+    - Edition windows and birth dates are parsed once before the event loop;
+      each event row then costs two dict lookups and integer arithmetic via
+      _age_from_ymd(), with the same rules as calculate_age().
     - competition_date is always prioritized because it represents the true
       athletic competition period.
     - Age is always computed using cleaned dates; uncleaned or missing dates
@@ -1024,30 +1108,57 @@ def add_age_to_events(event_rows: List[List[str]],
                 if event_date:
                     edition_dates[edition_id] = event_date
 
+    # --- Parse every date once, up front ---
+    # Ages only depend on the athlete's birth date and the edition window, so
+    # both are parsed once here and the per-event loop does integer work only.
+    edition_windows = {
+        edition_id: parse_event_window(event_date)
+        for edition_id, event_date in edition_dates.items()
+    }
+    # Many athletes share a birth date, so each distinct string is parsed once
+    parsed_by_date = {
+        birth: parse_dd_mon_yyyy(birth)
+        for birth in set(birth_dates.values())
+    }
+    birth_parsed = {
+        athlete_id: parsed_by_date[birth]
+        for athlete_id, birth in birth_dates.items()
+        if birth
+    }
+
     # --- Add age column to event rows ---
     new_header = header + ["age"]
     result = [new_header]
+    add_row = result.append
+    header_len = len(header)
 
     for row in event_rows[1:]:
-        if len(row) < len(header):
-            row = row + [""] * (len(header) - len(row))
+        if len(row) < header_len:
+            row = row + [""] * (header_len - len(row))
 
         athlete_id = row[athlete_id_idx].strip()
         edition_id = row[edition_id_idx].strip()
 
         age = ""
         if athlete_id and edition_id:
-            birth = birth_dates.get(athlete_id, "")
-            event_date = edition_dates.get(edition_id, "")
-            if birth and event_date:
-                age = calculate_age(birth, event_date)
+            birth = birth_parsed.get(athlete_id)
+            window = edition_windows.get(edition_id)
+            if birth and window:
+                years = _age_from_ymd(birth, *window)
+                if years >= 0:
+                    age = str(years)
 
-        result.append(row + [age])
+        # Unpacking builds the output row in one allocation and leaves the
+        # caller's row untouched
+        add_row([*row, age])
 
     return result
 
 # ==================== GENERATE MEDAL TALLY by Gurjeet ====================
 
+# Slot of each counted medal in the (gold, silver, bronze) tallies
+_MEDAL_IDX: Dict[str, int] = {"Gold": 0, "Silver": 1, "Bronze": 2}
+
 def generate_medal_tally(event_rows: List[List[str]],
                          country_rows: List[List[str]],
                          games_rows: List[List[str]]) -> List[List[str]]:
@@ -1174,77 +1285,95 @@ def generate_medal_tally(event_rows: List[List[str]],
                     if eid:
                         edition_id_to_name[eid] = ename
 
-    tally: Dict[Tuple[str, str], Dict[str, object]] = {}
-    seen_paris_team_medals: Set[Tuple[str, str, str, str]] = set()
-
-    for row in event_rows[1:]:
-        if len(row) <= max(edition_id_idx, noc_idx, medal_idx, athlete_id_idx, edition_idx):
-            continue
+    min_len = max(edition_id_idx, noc_idx, medal_idx, athlete_id_idx, edition_idx)
+    body = [row for row in event_rows[1:] if len(row) > min_len]
+
+    # Transpose and normalize the needed columns once so the aggregation loop
+    # walks plain lists of ready-to-use values
+    editions = [row[edition_idx].strip() for row in body]
+    edition_ids = [row[edition_id_idx].strip() for row in body]
+    nocs = [row[noc_idx].strip().upper() for row in body]
+    medals = [row[medal_idx].strip() for row in body]
+    athlete_ids = [row[athlete_id_idx].strip() for row in body]
+    if team_idx >= 0:
+        teams = [row[team_idx] if team_idx < len(row) else "" for row in body]
+    else:
+        teams = [""] * len(body)
+    if event_idx >= 0:
+        event_names = [row[event_idx] if event_idx < len(row) else "" for row in body]
+    else:
+        event_names = [""] * len(body)
+
+    # Decide the Paris 2024 check once per distinct edition label, not per row
+    paris_editions = {
+        edition for edition in set(editions)
+        if "2024" in edition and "summer" in edition.lower()
+    }
 
-        edition = row[edition_idx].strip()
-        edition_id = row[edition_id_idx].strip()
-        noc = row[noc_idx].strip().upper()
-        medal = row[medal_idx].strip()
-        athlete_id = row[athlete_id_idx].strip()
+    # Each (edition_id, noc) group gets a small integer id; per-group values
+    # live in parallel lists indexed by that id
+    key_to_id: Dict[Tuple[str, str], int] = {}
+    group_editions: List[str] = []
+    group_athletes: List[int] = []
+    golds: List[int] = []
+    silvers: List[int] = []
+    bronzes: List[int] = []
+    medal_lists = (golds, silvers, bronzes)
+    athletes_seen: Set[Tuple[int, str]] = set()
+    seen_paris_team_medals: Set[Tuple[str, str, str, str]] = set()
 
+    for edition, edition_id, noc, medal, athlete_id, team, event_name in zip(
+            editions, edition_ids, nocs, medals, athlete_ids, teams, event_names):
         if not edition_id or not noc or not athlete_id:
             continue
 
-        is_team = False
-        if team_idx >= 0 and team_idx < len(row):
-            is_team = row[team_idx].strip().lower() == "true"
-
-        event_name = ""
-        if event_idx >= 0 and event_idx < len(row):
-            event_name = row[event_idx].strip()
-
-        is_paris_2024 = "2024" in edition and "summer" in edition.lower()
-
         key = (edition_id, noc)
-        if key not in tally:
-            tally[key] = {
-                "edition": edition,
-                "athletes": set(),
-                "gold": 0,
-                "silver": 0,
-                "bronze": 0,
-            }
-
-        tally[key]["athletes"].add(athlete_id)
+        kid = key_to_id.get(key)
+        if kid is None:
+            kid = key_to_id[key] = len(group_editions)
+            group_editions.append(edition)
+            group_athletes.append(0)
+            golds.append(0)
+            silvers.append(0)
+            bronzes.append(0)
+
+        athlete_key = (kid, athlete_id)
+        if athlete_key not in athletes_seen:
+            athletes_seen.add(athlete_key)
+            group_athletes[kid] += 1
 
         if not medal:
             continue
 
-        if is_paris_2024 and is_team and event_name:
-            team_key = (edition_id, noc, event_name, medal)
-            if team_key in seen_paris_team_medals:
-                continue
-            seen_paris_team_medals.add(team_key)
+        if edition in paris_editions and event_name:
+            is_team = team.strip().lower() == "true"
+            event_name = event_name.strip()
+            if is_team and event_name:
+                team_key = (edition_id, noc, event_name, medal)
+                if team_key in seen_paris_team_medals:
+                    continue
+                seen_paris_team_medals.add(team_key)
 
-        if medal == "Gold":
-            tally[key]["gold"] += 1
-        elif medal == "Silver":
-            tally[key]["silver"] += 1
-        elif medal == "Bronze":
-            tally[key]["bronze"] += 1
+        code = _MEDAL_IDX.get(medal)
+        if code is not None:
+            medal_lists[code][kid] += 1
 
     result: List[List[str]] = [header]
 
-    def sort_key(item: Tuple[Tuple[str, str], Dict[str, object]]):
+    def sort_key(item: Tuple[Tuple[str, str], int]):
         (edition_id, noc), _ = item
         try:
             return (int(edition_id), noc)
         except ValueError:
             return (0, noc)
 
-    for (edition_id, noc), data in sorted(tally.items(), key=sort_key):
-        edition_name = edition_id_to_name.get(edition_id, data["edition"]) 
+    for (edition_id, noc), kid in sorted(key_to_id.items(), key=sort_key):
+        edition_name = edition_id_to_name.get(edition_id, group_editions[kid])
         country = noc_to_country.get(noc, noc)
-        athletes_set: Set[str] = data["athletes"] 
-        num_athletes = len(athletes_set)
-        gold = int(data["gold"]) 
-        silver = int(data["silver"])
-        bronze = int(data["bronze"])
+        num_athletes = group_athletes[kid]
+        gold = golds[kid]
+        silver = silvers[kid]
+        bronze = bronzes[kid]
         total = gold + silver + bronze
 
         result.append([
@@ -1262,6 +1391,13 @@ def generate_medal_tally(event_rows: List[List[str]],
     return result
 
 # ==================== PARIS INTEGRATION by Gurjeet and Minhaz  ====================
+
+# Edition label written into every Paris 2024 event row
+_PARIS_EDITION = "2024 Summer Olympics"
+
+# Bio 'sex' value for the first character of a Paris gender field
+_SEX_BY_INITIAL: Dict[str, str] = {"M": "Male", "m": "Male", "F": "Female", "f": "Female"}
+
 def format_athlete_name(name: str) -> str:
     """
     Normalize a raw name string into 'First Last' formatting by applying
@@ -1301,14 +1437,15 @@ def format_athlete_name(name: str) -> str:
     if not name:
         return ""
 
-    words = name.lower().split()
-    formatted_words = []
-    for w in words:
-        # Handle hyphenated parts inside a word
-        parts = w.split("-")
-        parts = [p[:1].upper() + p[1:] if p else "" for p in parts]
-        formatted_words.append("-".join(parts))
-    return " ".join(formatted_words)
+    lowered = name.lower()
+    if "-" not in lowered:
+        return " ".join([w[:1].upper() + w[1:] for w in lowered.split()])
+
+    # Handle hyphenated parts inside a word
+    return " ".join([
+        "-".join([p[:1].upper() + p[1:] for p in w.split("-")])
+        for w in lowered.split()
+    ])
 
 def normalize_paris_name(raw_name: str, alt_display: str = "") -> str:
     """
@@ -1393,6 +1530,43 @@ def normalize_paris_name(raw_name: str, alt_display: str = "") -> str:
     # Fallback: use as-is but in proper case
     return format_athlete_name(raw_name)
 
+# Characters that force the full literal parser in parse_paris_list()
+_LIST_ITEM_SPECIALS = frozenset("'\"\\\n\r\x00")
+
+def parse_paris_list(value: str) -> list:
+    """
+    Parse a serialized list cell from the Paris CSVs (e.g. "['A', 'B']").
+
+    Behaves exactly like ast.literal_eval(value.replace("'", '"')), including
+    raising ValueError/SyntaxError on malformed input, but handles the common
+    "['a', 'b']" layout with a plain split instead of invoking the Python
+    parser. Anything outside that layout (double-quoted items, embedded
+    quotes or backslashes, odd spacing) goes through literal_eval as before.
+    """
+    if value == "[]":
+        return []
+    if len(value) >= 4 and value[:2] == "['" and value[-2:] == "']":
+        items = value[2:-2].split("', '")
+        if all(_LIST_ITEM_SPECIALS.isdisjoint(item) for item in items):
+            return items
+    return ast.literal_eval(value.replace("'", '"'))
+
+@functools.lru_cache(maxsize=None)
+def _paris_medal_and_pos(medal_type: str) -> Tuple[str, str]:
+    """
+    Map a Paris 'medal_type' value (e.g. 'Gold Medal') to the (medal, pos)
+    pair written into event results, or ("", "") if it names no medal. The
+    column only holds a handful of distinct values, so each is resolved once.
+    """
+    mt = medal_type.lower()
+    if "gold" in mt:
+        return "Gold", "1"
+    if "silver" in mt:
+        return "Silver", "2"
+    if "bronze" in mt:
+        return "Bronze", "3"
+    return "", ""
+
 
 def integrate_paris_data(athlete_bio: List[List[str]],
                          event_results: List[List[str]],
@@ -1532,7 +1706,7 @@ def integrate_paris_data(athlete_bio: List[List[str]],
 
     Notes
     -----
-    - Athlete matching uses a normalized key: `name.lower() + "_" + NOC`, with
+    - Athlete matching uses a normalized key: `(name.lower(), NOC)`, with
       Paris names normalized via normalize_paris_name() to align with the main
       bio format.
     - New athlete_id and result_id values are generated by scanning existing
@@ -1592,35 +1766,35 @@ def integrate_paris_data(athlete_bio: List[List[str]],
     except ValueError:
         bio_country_idx = -1
 
-    # Build existing athlete lookup (name + noc)
-    existing_athletes: Dict[str, str] = {}
-    for row in athlete_bio[1:]:
-        if len(row) > bio_noc_idx:
+    # One pass over the bios builds the name + noc lookup, the
+    # athlete_id -> row index map (for O(1) updates) and the max athlete_id
+    updated_bio = list(athlete_bio)
+    existing_athletes: Dict[Tuple[str, str], str] = {}
+    id_to_bio_idx: Dict[str, int] = {}
+    max_athlete_id = 0
+    for idx, row in enumerate(updated_bio[1:], start=1):
+        row_len = len(row)
+        if row_len <= bio_id_idx:
+            continue
+
+        aid = row[bio_id_idx].strip()
+        if aid:
+            id_to_bio_idx[aid] = idx
+            try:
+                athlete_id = int(aid)
+                if athlete_id > max_athlete_id:
+                    max_athlete_id = athlete_id
+            except ValueError:
+                pass
+
+        if row_len > bio_noc_idx:
             name = row[bio_name_idx].strip().lower()
             noc = row[bio_noc_idx].strip().upper()
             if name and noc:
-                key = f"{name}_{noc}"
+                key = (name, noc)
                 existing_athletes[key] = row[bio_id_idx]
 
-    # --- PERF: map athlete_id -> row index for O(1) updates ---
-    updated_bio = list(athlete_bio)
-    id_to_bio_idx: Dict[str, int] = {}
-    for idx, row in enumerate(updated_bio):
-        if len(row) > bio_id_idx:
-            aid = row[bio_id_idx].strip()
-            if aid:
-                id_to_bio_idx[aid] = idx
-    
-    # Find max IDs
-    max_athlete_id = 0
-    for row in athlete_bio[1:]:
-        try:
-            athlete_id = int(row[bio_id_idx].strip())
-            if athlete_id > max_athlete_id:
-                max_athlete_id = athlete_id
-        except (ValueError, IndexError):
-            pass
-    
+    # Find max result ID
     max_result_id = 0
     for row in event_results[1:]:
         try:
@@ -1633,8 +1807,9 @@ def integrate_paris_data(athlete_bio: List[List[str]],
     next_athlete_id = max_athlete_id + 1
     next_result_id = max_result_id + 1
     
-    # Build event to sport mapping from paris_events
-    event_to_sport: Dict[str, str] = {}
+    # Build event to sport mapping from paris_events; events missing from
+    # paris_events resolve to "Unknown" with a plain subscript
+    event_to_sport: DefaultDict[str, str] = defaultdict(lambda: "Unknown")
     if paris_events and len(paris_events) > 1:
         e_header = paris_events[0]
         try:
@@ -1689,13 +1864,25 @@ def integrate_paris_data(athlete_bio: List[List[str]],
     except ValueError:
         p_weight_idx = -1
 
-    updated_events = list(event_results)
+    # New Paris event rows are buffered and joined onto event_results once at
+    # the end, so the large results list is copied a single time
+    new_event_rows: List[List[str]] = []
+
+    # Row templates; copying one is cheaper than rebuilding [""] * n. Every
+    # new event row belongs to Paris 2024, so the edition fields are preset.
+    event_template = [""] * len(event_header)
+    event_template[event_edition_idx] = _PARIS_EDITION
+    event_template[event_edition_id_idx] = paris_edition_id
+    bio_template = [""] * len(bio_header)
     
     # -----------------------------
     # Medallists: medal info + team events via code_team
     # -----------------------------
     team_event_names: Set[str] = set()
     medalist_info: Dict[Tuple[str, str], str] = {}
+    # Medallist rows for the medal-only pass, staged here so the file is
+    # walked once; they are emitted after the athlete and team loops
+    medal_only_rows: List[Tuple[str, str, str, str, str, List[str]]] = []
 
     if paris_medallists and len(paris_medallists) > 1:
         m_header = paris_medallists[0]
@@ -1711,6 +1898,17 @@ def integrate_paris_data(athlete_bio: List[List[str]],
             m_code_team_idx = m_header.index("code_team")
         except ValueError:
             m_code_team_idx = -1
+
+        # Columns the medal-only pass needs on top of the ones above
+        try:
+            m_name_idx = m_header.index("name")
+            m_gender_idx = m_header.index("gender")
+            m_country_idx = m_header.index("country_code")
+        except ValueError:
+            m_name_idx = m_gender_idx = m_country_idx = -1
+        stage_medal_only = m_name_idx >= 0 and m_country_idx >= 0
+        medal_only_min_len = max(m_code_idx, m_name_idx, m_country_idx,
+                                 m_event_idx, m_medal_idx)
         
         if m_code_idx >= 0 and m_medal_idx >= 0 and m_event_idx >= 0:
             for row in paris_medallists[1:]:
@@ -1729,32 +1927,48 @@ def integrate_paris_data(athlete_bio: List[List[str]],
                     code_team = row[m_code_team_idx].strip()
                     if code_team and event_name:
                         team_event_names.add(event_name)
+
+                if stage_medal_only and len(row) > medal_only_min_len:
+                    name = format_athlete_name(row[m_name_idx].strip())
+                    country = row[m_country_idx].strip().upper()
+                    if code and name and country and event_name:
+                        medal_only_rows.append(
+                            (code, name, country, event_name, medal.lower(), row))
     
     athlete_count = 0
     event_count = 0
     
-    # Create a mapping from athlete code to athlete info for faster lookups
-    code_to_athlete_info: Dict[str, Dict[str, str]] = {}
+    # Map each Paris athlete code to its resolved athlete_id; the team and
+    # medal-only passes only ever need the id
+    code_to_athlete_id: Dict[str, str] = {}
+    parsed_events: Dict[str, list] = {}
     
     # Process ALL Paris athletes
+    # Rows shorter than the header are skipped, so every column index from
+    # p_header is in range: required columns come out in a single call and
+    # optional ones only need their "column exists" check
+    get_athlete_fields = itemgetter(p_code_idx, p_name_idx, p_gender_idx,
+                                    p_country_idx, p_birth_idx, p_events_idx)
+
     for row in paris_athletes[1:]:
         if len(row) < len(p_header):
             continue
-        
-        code = row[p_code_idx].strip()
-        raw_name = row[p_name_idx].strip()
-        alt_name = row[p_name_tv_idx].strip() if 0 <= p_name_tv_idx < len(row) and p_name_tv_idx < len(row) else ""
+
+        code, raw_name, gender, noc, birth, events_str = get_athlete_fields(row)
+        code = code.strip()
+        raw_name = raw_name.strip()
+        alt_name = row[p_name_tv_idx].strip() if p_name_tv_idx >= 0 else ""
         name = normalize_paris_name(raw_name, alt_name)
 
-        gender = row[p_gender_idx].strip() if p_gender_idx < len(row) else ""
-        noc = row[p_country_idx].strip().upper() if p_country_idx < len(row) else ""
-        country_name = row[p_country_name_idx].strip() if 0 <= p_country_name_idx < len(row) and p_country_name_idx < len(row) else ""
+        gender = gender.strip()
+        noc = noc.strip().upper()
+        country_name = row[p_country_name_idx].strip() if p_country_name_idx >= 0 else ""
+
+        height = row[p_height_idx].strip() if p_height_idx >= 0 else ""
+        weight = row[p_weight_idx].strip() if p_weight_idx >= 0 else ""
+        birth = birth.strip()
+        events_str = events_str.strip()
 
-        height = row[p_height_idx].strip() if 0 <= p_height_idx < len(row) and p_height_idx < len(row) else ""
-        weight = row[p_weight_idx].strip() if 0 <= p_weight_idx < len(row) and p_weight_idx < len(row) else ""
-        birth = row[p_birth_idx].strip() if p_birth_idx < len(row) else ""
-        events_str = row[p_events_idx].strip() if p_events_idx < len(row) else "[]"
-        
         if not code or not name or not noc:
             continue
 
@@ -1764,20 +1978,8 @@ def integrate_paris_data(athlete_bio: List[List[str]],
         if weight == "0":
             weight = ""
         
-        # Store athlete info for team event processing
-        code_to_athlete_info[code] = {
-            'name': name,
-            'gender': gender,
-            'country': noc,          # country_noc
-            'birth': birth,
-            'events_str': events_str,
-            'height': height,
-            'weight': weight,
-            'country_name': country_name,
-        }
-        
         # Check if athlete already exists in main bio
-        key = f"{name.lower()}_{noc}"
+        key = (name.lower(), noc)
         athlete_id = existing_athletes.get(key)
         
         # Add athlete if not exists
@@ -1786,10 +1988,10 @@ def integrate_paris_data(athlete_bio: List[List[str]],
             athlete_id = str(next_athlete_id)
             next_athlete_id += 1
             
-            new_athlete = [""] * len(bio_header)
+            new_athlete = bio_template.copy()
             new_athlete[bio_id_idx] = athlete_id
             new_athlete[bio_name_idx] = name
-            new_athlete[bio_sex_idx] = "Male" if gender.lower().startswith("m") else "Female"
+            new_athlete[bio_sex_idx] = _SEX_BY_INITIAL.get(gender[:1], "Female")
             new_athlete[bio_born_idx] = cleaned_birth
             new_athlete[bio_noc_idx] = noc
 
@@ -1830,41 +2032,36 @@ def integrate_paris_data(athlete_bio: List[List[str]],
                 if bio_country_idx >= 0 and not bio_row[bio_country_idx] and country_name:
                     bio_row[bio_country_idx] = country_name
         
-        # Store athlete_id for code lookup
-        code_to_athlete_info[code]['athlete_id'] = athlete_id
+        # Store athlete_id for code lookup in the team and medal-only passes
+        code_to_athlete_id[code] = athlete_id
         
-        # Parse events list
-        try:
-            events_clean = events_str.replace("'", '"')
-            events_list = ast.literal_eval(events_clean)
-            if not isinstance(events_list, list):
-                events_list = [events_list]
-        except (ValueError, SyntaxError):
-            # Simple manual fallback
-            events_clean = events_str.strip("[]")
-            events_list = [e.strip().strip('"\'') for e in events_clean.split(",") if e.strip()]
+        # Parse events list (athletes share a few hundred distinct lists,
+        # so each distinct string is parsed once)
+        events_list = parsed_events.get(events_str)
+        if events_list is None:
+            try:
+                events_list = parse_paris_list(events_str)
+                if not isinstance(events_list, list):
+                    events_list = [events_list]
+            except (ValueError, SyntaxError):
+                # Simple manual fallback
+                events_clean = events_str.strip("[]")
+                events_list = [e.strip().strip('"\'') for e in events_clean.split(",") if e.strip()]
+            parsed_events[events_str] = events_list
         
         for event_name in events_list:
             if not event_name:
                 continue
             
-            sport = event_to_sport.get(event_name, "Unknown")
+            sport = event_to_sport[event_name]
             
             medal = ""
             pos = ""
             medal_type = medalist_info.get((code, event_name))
             if medal_type:
-                mt = medal_type.lower()
-                if "gold" in mt:
-                    medal, pos = "Gold", "1"
-                elif "silver" in mt:
-                    medal, pos = "Silver", "2"
-                elif "bronze" in mt:
-                    medal, pos = "Bronze", "3"
+                medal, pos = _paris_medal_and_pos(medal_type)
             
-            new_event = [""] * len(event_header)
-            new_event[event_edition_idx] = "2024 Summer Olympics"
-            new_event[event_edition_id_idx] = paris_edition_id
+            new_event = event_template.copy()
             new_event[event_noc_idx] = noc
             new_event[event_sport_idx] = sport
             new_event[event_event_idx] = event_name
@@ -1879,7 +2076,7 @@ def integrate_paris_data(athlete_bio: List[List[str]],
             is_team_event = event_name in team_event_names
             new_event[event_team_idx] = "True" if is_team_event else "False"
             
-            updated_events.append(new_event)
+            new_event_rows.append(new_event)
             event_count += 1
     
     print(f"Added {athlete_count} Paris athletes and {event_count} individual events")
@@ -1903,7 +2100,12 @@ def integrate_paris_data(athlete_bio: List[List[str]],
             team_count = 0
             # PERF: track team events we've added
             team_event_seen: Set[Tuple[str, str]] = set()
-            
+
+            # Team rows never carry a position or medal here and are always
+            # team sport rows, so only the varying fields are set per row
+            team_event_template = event_template.copy()
+            team_event_template[event_team_idx] = "True"
+
             for row in paris_teams[1:]:
                 if len(row) <= max(t_team_idx, t_country_idx, t_discipline_idx, 
                                    t_event_idx, t_athletes_idx, t_athletes_codes_idx):
@@ -1920,10 +2122,8 @@ def integrate_paris_data(athlete_bio: List[List[str]],
                     continue
                 
                 try:
-                    athletes_clean = athletes_str.replace("'", '"')
-                    codes_clean = athlete_codes_str.replace("'", '"')
-                    athletes_list = ast.literal_eval(athletes_clean)
-                    athlete_codes_list = ast.literal_eval(codes_clean)
+                    athletes_list = parse_paris_list(athletes_str)
+                    athlete_codes_list = parse_paris_list(athlete_codes_str)
                 except (ValueError, SyntaxError):
                     continue
                 
@@ -1934,13 +2134,10 @@ def integrate_paris_data(athlete_bio: List[List[str]],
                     
                     athlete_name = format_athlete_name(athlete_name)
 
-                    # Find athlete ID using code_to_athlete_info mapping
-                    athlete_id = None
-                    info = code_to_athlete_info.get(athlete_code)
-                    if info:
-                        athlete_id = info.get("athlete_id")
-                    else:
-                        key = f"{athlete_name.lower()}_{country}"
+                    # Find athlete ID using code_to_athlete_id mapping
+                    athlete_id = code_to_athlete_id.get(athlete_code)
+                    if athlete_id is None:
+                        key = (athlete_name.lower(), country)
                         athlete_id = existing_athletes.get(key)
                     
                     if not athlete_id:
@@ -1951,9 +2148,7 @@ def integrate_paris_data(athlete_bio: List[List[str]],
                         continue
                     team_event_seen.add(key_ev)
                     
-                    new_event = [""] * len(event_header)
-                    new_event[event_edition_idx] = "2024 Summer Olympics"
-                    new_event[event_edition_id_idx] = paris_edition_id
+                    new_event = team_event_template.copy()
                     new_event[event_noc_idx] = country
                     new_event[event_sport_idx] = discipline
                     new_event[event_event_idx] = event_name
@@ -1961,122 +2156,79 @@ def integrate_paris_data(athlete_bio: List[List[str]],
                     next_result_id += 1
                     new_event[event_athlete_idx] = athlete_name
                     new_event[event_athlete_id_idx] = athlete_id
-                    new_event[event_pos_idx] = ""
-                    new_event[event_medal_idx] = ""
-                    new_event[event_team_idx] = "True"
                     
-                    updated_events.append(new_event)
+                    new_event_rows.append(new_event)
                     event_count += 1
                     team_count += 1
             
             print(f"Added {team_count} team events")
     
     # --- MEDAL-ONLY EVENTS (for any left-over medallists) ---
-    if paris_medallists and len(paris_medallists) > 1:
-        m_header = paris_medallists[0]
-        try:
-            m_code_idx = m_header.index("code_athlete")
-            m_name_idx = m_header.index("name")
-            m_gender_idx = m_header.index("gender")
-            m_country_idx = m_header.index("country_code")
-            m_event_idx = m_header.index("event")
-            m_medal_idx = m_header.index("medal_type")
-        except ValueError:
-            m_code_idx = m_name_idx = m_gender_idx = m_country_idx = m_event_idx = m_medal_idx = -1
-        
-        if all(idx >= 0 for idx in [m_code_idx, m_name_idx, m_country_idx, m_event_idx, m_medal_idx]):
-            medal_only_count = 0
-            # PERF: track medal events we've already added
-            medal_event_seen: Set[Tuple[str, str]] = set()
+    if medal_only_rows:
+        medal_only_count = 0
+        # PERF: track medal events we've already added
+        medal_event_seen: Set[Tuple[str, str]] = set()
+
+        for code, name, country, event_name, medal_type, row in medal_only_rows:
+            # Find athlete ID
+            athlete_id = code_to_athlete_id.get(code)
+            if athlete_id is None:
+                key = (name.lower(), country)
+                athlete_id = existing_athletes.get(key)
             
-            for row in paris_medallists[1:]:
-                if len(row) <= max(m_code_idx, m_name_idx, m_country_idx, m_event_idx, m_medal_idx):
-                    continue
+            if not athlete_id:
+                # Create new athlete (rare path)
+                athlete_id = str(next_athlete_id)
+                next_athlete_id += 1
                 
-                code = row[m_code_idx].strip()
-                raw_medal_name = row[m_name_idx].strip()
-                name = format_athlete_name(raw_medal_name)
-                country = row[m_country_idx].strip().upper()
-                event_name = row[m_event_idx].strip()
-                medal_type = row[m_medal_idx].strip().lower()
-                
-                if not code or not name or not country or not event_name:
-                    continue
+                new_athlete = bio_template.copy()
+                new_athlete[bio_id_idx] = athlete_id
+                new_athlete[bio_name_idx] = name
+                # crude gender guess: if row gender exists, use it; else, default
+                gender_val = row[m_gender_idx].strip() if m_gender_idx < len(row) else ""
+                new_athlete[bio_sex_idx] = _SEX_BY_INITIAL.get(gender_val[:1], "")
+                new_athlete[bio_born_idx] = ""
+                new_athlete[bio_noc_idx] = country
                 
-                # Find athlete ID
-                athlete_id = None
-                info = code_to_athlete_info.get(code)
-                if info:
-                    athlete_id = info.get("athlete_id")
-                else:
-                    key = f"{name.lower()}_{country}"
-                    athlete_id = existing_athletes.get(key)
-                
-                if not athlete_id:
-                    # Create new athlete (rare path)
-                    athlete_id = str(next_athlete_id)
-                    next_athlete_id += 1
-                    
-                    new_athlete = [""] * len(bio_header)
-                    new_athlete[bio_id_idx] = athlete_id
-                    new_athlete[bio_name_idx] = name
-                    # crude gender guess: if row gender exists, use it; else, default
-                    gender_val = row[m_gender_idx].strip().lower() if m_gender_idx >= 0 and m_gender_idx < len(row) else ""
-                    if gender_val.startswith("m"):
-                        new_athlete[bio_sex_idx] = "Male"
-                    elif gender_val.startswith("f"):
-                        new_athlete[bio_sex_idx] = "Female"
-                    else:
-                        new_athlete[bio_sex_idx] = ""
-                    new_athlete[bio_born_idx] = ""
-                    new_athlete[bio_noc_idx] = country
-                    
-                    idx = len(updated_bio)
-                    updated_bio.append(new_athlete)
-                    id_to_bio_idx[athlete_id] = idx
-                    existing_athletes[f"{name.lower()}_{country}"] = athlete_id
-                    athlete_count += 1
-                
-                key_ev = (athlete_id, event_name)
-                if key_ev in medal_event_seen:
-                    continue
-                medal_event_seen.add(key_ev)
-                
-                sport = event_to_sport.get(event_name, "Unknown")
-                
-                medal = ""
-                pos = ""
-                if "gold" in medal_type:
-                    medal, pos = "Gold", "1"
-                elif "silver" in medal_type:
-                    medal, pos = "Silver", "2"
-                elif "bronze" in medal_type:
-                    medal, pos = "Bronze", "3"
-                
-                new_event = [""] * len(event_header)
-                new_event[event_edition_idx] = "2024 Summer Olympics"
-                new_event[event_edition_id_idx] = paris_edition_id
-                new_event[event_noc_idx] = country
-                new_event[event_sport_idx] = sport
-                new_event[event_event_idx] = event_name
-                new_event[event_result_id_idx] = str(next_result_id)
-                next_result_id += 1
-                new_event[event_athlete_idx] = name
-                new_event[event_athlete_id_idx] = athlete_id
-                new_event[event_pos_idx] = pos
-                new_event[event_medal_idx] = medal
-
-                # team flag for medal-only rows as well
-                is_team_event = event_name in team_event_names
-                new_event[event_team_idx] = "True" if is_team_event else "False"
-                
-                updated_events.append(new_event)
-                event_count += 1
-                medal_only_count += 1
+                idx = len(updated_bio)
+                updated_bio.append(new_athlete)
+                id_to_bio_idx[athlete_id] = idx
+                existing_athletes[(name.lower(), country)] = athlete_id
+                athlete_count += 1
             
-            if medal_only_count > 0:
-                print(f"Added {medal_only_count} additional medal events")
-    
+            key_ev = (athlete_id, event_name)
+            if key_ev in medal_event_seen:
+                continue
+            medal_event_seen.add(key_ev)
+            
+            sport = event_to_sport[event_name]
+            
+            medal, pos = _paris_medal_and_pos(medal_type)
+            
+            new_event = event_template.copy()
+            new_event[event_noc_idx] = country
+            new_event[event_sport_idx] = sport
+            new_event[event_event_idx] = event_name
+            new_event[event_result_id_idx] = str(next_result_id)
+            next_result_id += 1
+            new_event[event_athlete_idx] = name
+            new_event[event_athlete_id_idx] = athlete_id
+            new_event[event_pos_idx] = pos
+            new_event[event_medal_idx] = medal
+
+            # team flag for medal-only rows as well
+            is_team_event = event_name in team_event_names
+            new_event[event_team_idx] = "True" if is_team_event else "False"
+            
+            new_event_rows.append(new_event)
+            event_count += 1
+            medal_only_count += 1
+        
+        if medal_only_count > 0:
+            print(f"Added {medal_only_count} additional medal events")
+
+    updated_events = event_results + new_event_rows
+
     print(f"Total Paris athletes: {athlete_count}, Total events: {event_count}")
     return updated_bio, updated_events, birth_dates
 
@@ -2215,14 +2367,14 @@ def main() -> None:
     # Check for Paris 2024 in medal tally - FAST VERSION
     paris_entries = 0
     for row in medal_tally[1:]:
-        if "2024 Summer Olympics" in str(row[0]):
+        if row[0] == _PARIS_EDITION:
             paris_entries += 1
     print(f"Paris 2024 medal tally entries: {paris_entries}")
     
     # Count Paris athletes - FAST VERSION
     paris_athlete_ids = set()
     for event_row in events_with_age[1:5000]:  # Check first 5000 rows only
-        if len(event_row) > 7 and "2024 Summer Olympics" in str(event_row[0]):
+        if len(event_row) > 7 and event_row[0] == _PARIS_EDITION:
             athlete_id = event_row[7]  # athlete_id column
             if athlete_id:
                 paris_athlete_ids.add(athlete_id)